@@ -0,0 +1,401 @@
+"""
+Behaviour tests for the Python binary search module (src/lib/algorithms/binary-search.py).
+
+Run with: python -m unittest discover -s src/__tests__/algorithms -p 'test_*.py'
+"""
+
+import copy
+import importlib.util
+import json
+import pickle
+import sys
+import unittest
+import warnings
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MODULE_PATH = Path(__file__).resolve().parents[2] / 'lib' / 'algorithms' / 'binary-search.py'
+
+_spec = importlib.util.spec_from_file_location('binary_search_module', MODULE_PATH)
+bs = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = bs
+_spec.loader.exec_module(bs)
+
+requires_numpy = unittest.skipIf(np is None, 'numpy is not installed')
+
+
+class TestValidation(unittest.TestCase):
+    def test_rejects_unsorted_and_non_finite_lists(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        for data in ([3, 1], [1, float('nan')], [1, float('inf')]):
+            with self.assertRaises(ValueError):
+                algorithm.execute(data, 1)
+
+    def test_validate_false_skips_checks(self):
+        self.assertEqual(bs.binary_search([1, 3, 5, 7], 5), 2)
+        with self.assertRaises(ValueError):
+            bs.binary_search([3, 1], 1, validate=True)
+
+    @requires_numpy
+    def test_accepts_numpy_scalar_targets(self):
+        data = np.array([1, 3, 5, 7, 9])
+        self.assertEqual(bs.binary_search(data, data[3], validate=True), 3)
+        result = bs.BinarySearchAlgorithm().execute(data, np.int64(5))
+        self.assertEqual(result.index, 2)
+        result = bs.BinarySearchAlgorithm().execute([1.0, 2.5], np.float64(2.5))
+        self.assertEqual(result.index, 1)
+
+    @requires_numpy
+    def test_rejects_unsorted_and_non_finite_arrays(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        for data in (np.array([3.0, 1.0]), np.array([1.0, np.nan])):
+            with self.assertRaises(ValueError):
+                algorithm.execute(data, 1)
+
+
+class TestExecuteIter(unittest.TestCase):
+    def test_streamed_steps_match_execute(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        data = list(range(1, 64, 2))
+        for name in ('binary', 'interp'):
+            for target in (-1, 1, 31, 32, 63, 64):
+                expected = algorithm.execute(data, target, algorithm=name)
+                streamed = list(algorithm.execute_iter(data, target, algorithm=name))
+                result = bs.BinarySearchResult(expected.found, expected.index, streamed, expected.comparisons)
+                self.assertEqual(result.to_dict(), expected.to_dict())
+
+    def test_paused_stream_is_independent_of_other_runs(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        data = list(range(0, 200, 2))
+        stream = algorithm.execute_iter(data, 1)
+        steps = [next(stream), next(stream)]
+        other = algorithm.execute(data, 150)
+        steps.extend(stream)
+        self.assertEqual(algorithm.comparisons, other.comparisons)
+        counts = [step.comparison_count for step in steps if isinstance(step, bs.Step)]
+        self.assertEqual(counts, list(range(1, len(counts) + 1)))
+        self.assertEqual(steps[-1]['m_totalComparisons'], len(counts))
+        self.assertEqual(steps[-1]['m_totalComparisons'], algorithm.execute(data, 1).comparisons)
+
+    def test_validates_before_first_step(self):
+        with self.assertRaises(ValueError):
+            bs.BinarySearchAlgorithm().execute_iter([3, 1], 1)
+        with self.assertRaises(ValueError):
+            bs.BinarySearchAlgorithm().execute_iter([1, 3], 1, algorithm='ternary')
+
+    def test_is_lazy(self):
+        steps = bs.BinarySearchAlgorithm().execute_iter(list(range(1000)), 999)
+        first = next(steps)
+        self.assertEqual(first['type'], 'init')
+        self.assertEqual(first['operationCount'], 1)
+        step = next(steps)
+        self.assertIsInstance(step, bs.Step)
+        self.assertEqual((step.left, step.right, step.comparison_count), (0, 999, 1))
+
+
+class TestGeneratedCases(unittest.TestCase):
+    def test_cases_run_directly(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        for case in bs.BinarySearchAlgorithm.generate_test_cases():
+            result = algorithm.execute(case['data'], case['target'])
+            self.assertEqual(result.found, case['expected']['found'])
+            if result.found:
+                self.assertEqual(case['data'][result.index], case['target'])
+            self.assertEqual(bs.binary_search(case['data'], case['target'], validate=True) != -1,
+                             case['expected']['found'])
+
+    def test_cases_are_json_serializable_and_read_only(self):
+        cases = bs.BinarySearchAlgorithm.generate_test_cases()
+        self.assertEqual(json.loads(json.dumps(cases))[0]['expected'], {'found': True, 'index': 2})
+        with self.assertRaises(TypeError):
+            cases[0]['target'] = 0
+        with self.assertRaises(TypeError):
+            cases[0]['expected'].update(found=False)
+
+    def test_cases_copy_and_pickle_to_plain_dicts(self):
+        case = bs.BinarySearchAlgorithm.generate_test_cases()[0]
+        for copied in (copy.copy(case), copy.deepcopy(case), pickle.loads(pickle.dumps(case))):
+            self.assertIs(type(copied), dict)
+            self.assertEqual(copied, case)
+        mutable = copy.deepcopy(case)
+        mutable['expected']['index'] = 0
+        self.assertEqual(case['expected']['index'], 2)
+
+
+class TestTrackedSteps(unittest.TestCase):
+    def test_iteration_steps_describe_themselves(self):
+        result = bs.BinarySearchAlgorithm().execute([1, 3, 5, 7, 9], 7)
+        iterations = [step for step in result.steps if isinstance(step, bs.Step)]
+        self.assertEqual(len(iterations), result.comparisons)
+        self.assertIn('Found target 7 at index 3', iterations[-1].describe())
+        self.assertEqual(iterations[0].describe().splitlines()[0], 'Search range: [0, 4] (5 elements)')
+
+    def test_to_dict_matches_step_shape(self):
+        result = bs.BinarySearchAlgorithm().execute([1, 3, 5, 7, 9], 4)
+        steps = result.to_dict()['steps']
+        self.assertEqual(len(steps), 2 + 4 * result.comparisons)
+        self.assertEqual([step['operationCount'] for step in steps], list(range(1, len(steps) + 1)))
+        self.assertEqual(steps[0]['type'], 'init')
+        self.assertTrue(steps[-1]['metadata']['searchExhausted'])
+        for step in steps:
+            self.assertIsInstance(step['description'], str)
+
+    def test_deferred_descriptions(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        data = [1, 3, 5, 7, 9]
+        for target in (7, 4):
+            described = algorithm.execute(data, target)
+            expected = [step['description'] for step in described.steps if not isinstance(step, bs.Step)]
+            result = algorithm.execute(data, target, emit_descriptions=False)
+            boundary = [step for step in result.steps if not isinstance(step, bs.Step)]
+            self.assertEqual([step['description'] for step in boundary], [None] * len(expected))
+            result.render_descriptions()
+            self.assertEqual([step['description'] for step in boundary], expected)
+            self.assertEqual(result.to_dict(), described.to_dict())
+
+    def test_to_dict_without_descriptions(self):
+        for target in (7, 4):
+            result = bs.BinarySearchAlgorithm().execute([1, 3, 5, 7, 9], target)
+            steps = result.to_dict(descriptions=False)['steps']
+            self.assertEqual(len(steps), len(result.to_dict()['steps']))
+            for step in steps:
+                self.assertIsNone(step['description'])
+
+    def test_ranges_are_pairs_unless_expanded(self):
+        result = bs.BinarySearchAlgorithm().execute(list(range(0, 40, 2)), 5)
+        compact = result.to_dict()['steps']
+        expanded = result.to_dict(expand_ranges=True)['steps']
+        self.assertEqual(len(compact), len(expanded))
+        ranged = 0
+        for pair_step, list_step in zip(compact, expanded):
+            self.assertNotIn('indicesRange', list_step)
+            if 'indicesRange' in pair_step:
+                ranged += 1
+                start, end = pair_step['indicesRange']
+                self.assertNotIn('indices', pair_step)
+                self.assertEqual(list_step['indices'], list(range(start, end + 1)))
+            else:
+                self.assertEqual(list_step, pair_step)
+        self.assertEqual(ranged, 2 * result.comparisons)
+
+    def test_boundary_steps_store_flat_metadata(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        cases = (([1, 3, 5], 4, ['init', 'eliminate']), ([], 4, ['init', 'eliminate']), ([1, 3, 5], 3, ['init']))
+        for data, target, types in cases:
+            result = algorithm.execute(data, target)
+            boundary = [step for step in result.steps if not isinstance(step, bs.Step)]
+            self.assertEqual([step['type'] for step in boundary], types)
+            for step in boundary:
+                self.assertNotIn('metadata', step)
+                self.assertTrue(any(key.startswith('m_') for key in step))
+            nested = [step for step in result.to_dict()['steps'] if step['type'] in ('init', 'eliminate')
+                      and 'eliminated' not in step['metadata']]
+            self.assertEqual(len(nested), len(boundary))
+            for raw, step in zip(boundary, nested):
+                self.assertFalse(any(key.startswith('m_') for key in step))
+                self.assertEqual(step['metadata'], {key[2:]: value for key, value in raw.items()
+                                                    if key.startswith('m_')})
+
+        init, empty = algorithm.execute([], 4).to_dict()['steps']
+        self.assertEqual(init['metadata'], {'target': 4, 'arrayLength': 0, 'algorithm': 'binary-search',
+                                            'language': 'python'})
+        self.assertEqual(empty['metadata'], {'found': False, 'reason': 'empty-array'})
+        missed = algorithm.execute([1, 3, 5], 4).to_dict()['steps'][-1]['metadata']
+        self.assertEqual(missed['totalComparisons'], 2)
+        self.assertTrue(missed['searchExhausted'])
+        self.assertFalse(missed['found'])
+
+    def test_step_log_indexing_matches_iteration(self):
+        result = bs.BinarySearchAlgorithm().execute(list(range(0, 200, 3)), 100)
+        steps = list(result.steps)
+        self.assertEqual([result.steps[i] for i in range(len(steps))], steps)
+        self.assertEqual(result.steps[-1], steps[-1])
+        self.assertEqual(result.steps[1:4], steps[1:4])
+        with self.assertRaises(IndexError):
+            result.steps[len(steps)]
+
+    def test_steps_are_unaffected_by_later_data_changes(self):
+        data = [1, 3, 5, 7, 9, 11]
+        result = bs.BinarySearchAlgorithm().execute(data, 9)
+        before = result.to_dict()
+        data[:] = [0] * len(data)
+        self.assertEqual(result.to_dict(), before)
+
+    @requires_numpy
+    def test_numpy_input_serializes_to_json(self):
+        data = np.arange(1, 40, 2)
+        result = bs.BinarySearchAlgorithm().execute(data, np.int64(9))
+        payload = json.loads(json.dumps(result.to_dict()))
+        self.assertEqual(payload['index'], 4)
+        self.assertIs(type(result.steps[1].mid_value), int)
+
+
+@requires_numpy
+class TestArraySearch(unittest.TestCase):
+    def test_finds_every_element_and_misses(self):
+        data = np.arange(0, 40, 2)
+        for i, value in enumerate(data):
+            self.assertEqual(bs.binary_search(data, value), i)
+        self.assertEqual(bs.binary_search(data, 3), -1)
+        self.assertEqual(bs.binary_search(data, -1), -1)
+        self.assertEqual(bs.binary_search(np.array([], dtype=np.int64), 1), -1)
+
+    def test_non_native_byte_order(self):
+        data = np.arange(10).astype('>i8')
+        self.assertEqual(bs.binary_search(data, 5), 5)
+        self.assertEqual(bs.binary_search(data, 11), -1)
+
+    def test_read_only_arrays(self):
+        for dtype in (np.int64, np.float64):
+            data = np.frombuffer(np.arange(10, dtype=dtype).tobytes(), dtype=dtype)
+            self.assertEqual(bs.binary_search(data, 5), 5)
+            copy = np.arange(10, dtype=dtype)
+            copy.flags.writeable = False
+            self.assertEqual(bs.binary_search(copy, 11), -1)
+
+    def test_out_of_range_integer_target(self):
+        self.assertEqual(bs.binary_search(np.arange(10), 2 ** 70), -1)
+
+    def test_out_of_range_numpy_integer_target(self):
+        self.assertEqual(bs.binary_search(np.arange(10), np.uint64(2 ** 64 - 1)), -1)
+        self.assertEqual(bs.binary_search(np.arange(10), np.uint64(7)), 7)
+        layout = bs.build_eytzinger(np.arange(10))
+        self.assertEqual(bs.search_eytzinger(layout, np.uint64(2 ** 64 - 1)), -1)
+
+
+class TestInterpolationSearch(unittest.TestCase):
+    def test_interp_and_auto_agree_with_binary(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        datasets = [[1, 2, 3, 4, 5, 6, 7, 8, 9, 10], list(range(0, 300, 3)), [1, 2, 4, 8, 16, 1000, 10 ** 6], [4, 4, 4, 4]]
+        if np is not None:
+            datasets.append(np.arange(0, 250, 5, dtype=np.uint8))
+        for data in datasets:
+            values = list(data)
+            for target in [int(values[0]) - 1, int(values[-1]) + 1] + values:
+                expected = algorithm.execute(data, target).found
+                for name in ('interp', 'auto'):
+                    # With duplicates any matching index is acceptable
+                    for track_steps in (True, False):
+                        result = algorithm.execute(data, target, track_steps=track_steps, algorithm=name)
+                        self.assertEqual(result.found, expected)
+                        if result.found:
+                            self.assertEqual(data[result.index], target)
+
+    @requires_numpy
+    def test_numpy_integer_arrays_do_not_overflow(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        data = np.arange(0, 250, 5, dtype=np.uint8)
+        as_list = data.tolist()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for target in range(256):
+                for name in ('interp', 'auto'):
+                    result = algorithm.execute(data, target, algorithm=name)
+                    self.assertEqual(result.found, target in as_list)
+                    if result.found:
+                        self.assertEqual(as_list[result.index], target)
+                    self.assertEqual(result.comparisons,
+                                     algorithm.execute(as_list, target, algorithm=name).comparisons)
+            limits = np.iinfo(np.int64)
+            extreme = np.array([limits.min + k * 2 ** 58 for k in range(63)] + [limits.max], dtype=np.int64)
+            result = algorithm.execute(extreme, int(extreme[10]), algorithm='auto')
+            self.assertEqual(result.index, 10)
+
+    def test_init_step_names_the_algorithm(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        uniform = list(range(100))
+        skewed = [2 ** i for i in range(20)]
+        metadata = algorithm.execute(uniform, 42, algorithm='interp').to_dict()['steps'][0]['metadata']
+        self.assertEqual(metadata['algorithm'], 'interpolation-search')
+        metadata = algorithm.execute(uniform, 42, algorithm='auto').to_dict()['steps'][0]['metadata']
+        self.assertEqual(metadata['algorithm'], 'interpolation-search')
+        metadata = algorithm.execute(skewed, 64, algorithm='auto').to_dict()['steps'][0]['metadata']
+        self.assertEqual(metadata['algorithm'], 'binary-search')
+
+    def test_uniform_data_takes_fewer_comparisons(self):
+        algorithm = bs.BinarySearchAlgorithm()
+        data = list(range(0, 10000, 7))
+        binary = algorithm.execute(data, data[1234])
+        interp = algorithm.execute(data, data[1234], algorithm='interp')
+        self.assertLess(interp.comparisons, binary.comparisons)
+
+    def test_unknown_algorithm_is_rejected(self):
+        with self.assertRaises(ValueError):
+            bs.BinarySearchAlgorithm().execute([1, 2, 3], 2, algorithm='ternary')
+
+
+class TestStatefulBinarySearcher(unittest.TestCase):
+    def test_matches_bisect_for_any_query_order(self):
+        data = [1, 2, 2, 2, 5, 8, 8, 13, 21, 34, 55]
+        searcher = bs.StatefulBinarySearcher(data)
+        queries = [0, 55, 1, 2, 8, 3, 34, 2, 60, 21, 5, 8, 1, 13]
+        for target in queries:
+            expected = data.index(target) if target in data else -1
+            self.assertEqual(searcher.search(target), expected)
+
+    def test_monotonic_stream(self):
+        data = list(range(0, 1000, 2))
+        searcher = bs.StatefulBinarySearcher(data)
+        for i, value in enumerate(data):
+            self.assertEqual(searcher.search(value), i)
+            self.assertEqual(searcher.search(value + 1), -1)
+
+    def test_empty_and_reassigned_data(self):
+        searcher = bs.StatefulBinarySearcher([])
+        self.assertEqual(searcher.search(1), -1)
+        searcher.data = list(range(100))
+        self.assertEqual(searcher.search(90), 90)
+        searcher.data = [1, 2, 3]
+        self.assertEqual(searcher.search(3), 2)
+        self.assertEqual(searcher.search(1), 0)
+
+
+class TestEytzinger(unittest.TestCase):
+    def test_layout_is_breadth_first(self):
+        self.assertEqual(list(bs.build_eytzinger([1, 2, 3, 4, 5, 6, 7])), [4, 2, 6, 1, 3, 5, 7])
+        self.assertEqual(len(bs.build_eytzinger([])), 0)
+
+    def test_search_finds_every_element_and_misses(self):
+        data = list(range(1, 60, 2))
+        layout = bs.build_eytzinger(data)
+        for value in data:
+            self.assertEqual(layout[bs.search_eytzinger(layout, value)], value)
+        for value in (0, 2, 60):
+            self.assertEqual(bs.search_eytzinger(layout, value), -1)
+
+    def test_duplicates_map_to_lower_bound(self):
+        layout, order = bs.build_eytzinger([1, 2, 2, 2, 5], return_order=True)
+        self.assertEqual(list(layout), [2, 2, 5, 1, 2])
+        self.assertEqual(list(order), [3, 1, 4, 0, 2])
+        position = bs.search_eytzinger(layout, 2)
+        self.assertEqual(position, 1)
+        self.assertEqual(order[position], 1)
+
+
+class TestBatchSearch(unittest.TestCase):
+    def test_returns_first_occurrence_or_minus_one(self):
+        data = [1, 2, 2, 2, 5, 8]
+        targets = [2, 0, 8, 9, 5, 3, 1]
+        self.assertEqual(list(bs.binary_search_batch(data, targets)), [1, -1, 5, -1, 4, -1, 0])
+
+    def test_empty_inputs(self):
+        self.assertEqual(list(bs.binary_search_batch([], [1, 2])), [-1, -1])
+        self.assertEqual(list(bs.binary_search_batch([1, 2], [])), [])
+
+    def test_validates_data_once(self):
+        with self.assertRaises(ValueError):
+            bs.binary_search_batch([3, 1, 2], [1])
+
+    @requires_numpy
+    def test_numpy_inputs(self):
+        data = np.arange(0.0, 50.0, 0.5)
+        targets = np.array([0.0, 0.25, 49.5, 50.0, 12.5])
+        self.assertEqual(bs.binary_search_batch(data, targets).tolist(), [0, -1, 99, -1, 25])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,27 +6,483 @@ This module provides a BinarySearchAlgorithm class that implements binary search
 with detailed step-by-step tracking for educational purposes.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from bisect import bisect_left
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from math import isfinite
+from numbers import Real
+from typing import List, Dict, Any, Iterator, Literal, Mapping, Optional, Tuple, Union
 import json
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (e.g. Pyodide without the package loaded)
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the interpreted path is used without it
+    njit = None
+
+
+@dataclass(slots=True)
+class Step:
+    """
+    One loop iteration of a tracked binary search.
+    
+    Holds only the raw values of the iteration; the legacy range, pointer,
+    compare and found/eliminate step dicts (including their descriptions)
+    are built on demand by to_dicts().
+    """
+    type: str
+    left: int
+    right: int
+    mid: int
+    target: Any
+    left_value: Any
+    mid_value: Any
+    right_value: Any
+    comparison: str
+    comparison_count: int
+    op_count: int
+    
+    def to_dicts(self, descriptions: bool = True) -> List[Dict[str, Any]]:
+        """
+        Expand the iteration into the legacy per-phase step dicts
+        
+        With descriptions=False every 'description' is None and no
+        strings are formatted.
+        """
+        left, right, mid = self.left, self.right, self.mid
+        target, mid_value = self.target, self.mid_value
+        steps = [
+            {
+                'type': 'highlight',
+                'indicesRange': (left, right),
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'searchRange': True,
+                    'rangeSize': right - left + 1
+                },
+                'description': f'Search range: [{left}, {right}] ({right - left + 1} elements)' if descriptions else None
+            },
+            {
+                'type': 'highlight',
+                'indices': [left, mid, right],
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'pointers': {'left': left, 'mid': mid, 'right': right},
+                    'leftValue': self.left_value,
+                    'midValue': mid_value,
+                    'rightValue': self.right_value
+                },
+                'description': f'Pointers: left={left}({self.left_value}), mid={mid}({mid_value}), right={right}({self.right_value})' if descriptions else None
+            },
+            {
+                'type': 'compare',
+                'indices': [mid],
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'targetValue': target,
+                    'midValue': mid_value,
+                    'comparison': self.comparison,
+                    'comparisonCount': self.comparison_count
+                },
+                'description': f'Compare: target({target}) {_COMPARISON_SYMBOLS[self.comparison]} mid({mid_value})' if descriptions else None
+            }
+        ]
+        
+        if self.comparison == 'equal':
+            steps.append({
+                'type': 'found',
+                'indices': [mid],
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'found': True,
+                    'targetValue': target,
+                    'foundIndex': mid,
+                    'totalComparisons': self.comparison_count
+                },
+                'description': f'🎉 Found target {target} at index {mid} after {self.comparison_count} comparisons!' if descriptions else None
+            })
+        elif self.comparison == 'greater':
+            # Target is in right half - eliminate left half
+            steps.append({
+                'type': 'eliminate',
+                'indicesRange': (left, mid),
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'eliminated': 'left',
+                    'eliminatedRange': [left, mid],
+                    'reason': f'{mid_value} < {target}',
+                    'remainingRange': [mid + 1, right],
+                    'remainingSize': right - mid
+                },
+                'description': f'{mid_value} < {target}: eliminate left half [{left}, {mid}], search [{mid + 1}, {right}]' if descriptions else None
+            })
+        else:
+            # Target is in left half - eliminate right half
+            steps.append({
+                'type': 'eliminate',
+                'indicesRange': (mid, right),
+                'metadata': {
+                    'left': left,
+                    'right': right,
+                    'mid': mid,
+                    'eliminated': 'right',
+                    'eliminatedRange': [mid, right],
+                    'reason': f'{mid_value} > {target}',
+                    'remainingRange': [left, mid - 1],
+                    'remainingSize': mid - left
+                },
+                'description': f'{mid_value} > {target}: eliminate right half [{mid}, {right}], search [{left}, {mid - 1}]' if descriptions else None
+            })
+        
+        return steps
+    
+    def describe(self) -> str:
+        """Human-readable description of the iteration, one phase per line"""
+        return '\n'.join(step['description'] for step in self.to_dicts())
+
+
+def _init_description(target: Union[int, float], length: int) -> str:
+    """Description for the init step"""
+    return f'Initialize binary search for target {target} in sorted array of {length} elements'
+
+
+def _not_found_description(target: Union[int, float], comparisons: int) -> str:
+    """Description for the final step of an unsuccessful search"""
+    return f'❌ Target {target} not found after {comparisons} comparisons (search space exhausted)'
+
+
+# Comparison codes stored in the StepLog type column; 0 marks a dict step.
+# A three-way comparison result c (-1, 0, 1) maps to code _CMP_EQUAL + c.
+_DICT_STEP = 0
+_CMP_LESS = 1
+_CMP_EQUAL = 2
+_CMP_GREATER = 3
+_COMPARISON_NAMES = (None, 'less', 'equal', 'greater')
+_COMPARISON_SYMBOLS = {'less': '<', 'equal': '==', 'greater': '>'}
+
+
+def _new_column(dtype: str, capacity: int) -> Any:
+    """Allocate a zeroed step column, as a numpy array when available"""
+    if np is not None:
+        return np.zeros(capacity, dtype)
+    return [0] * capacity
+
+
+def _grow_column(column: Any, capacity: int) -> Any:
+    """Resize a step column to the given capacity"""
+    if np is not None:
+        return np.resize(column, capacity)
+    return column + [0] * (capacity - len(column))
+
+
+def _column_values(column: Any, count: int) -> List[int]:
+    """Read the first count entries of a column as Python ints"""
+    if np is not None:
+        return column[:count].tolist()
+    return column[:count]
+
+
+def _python_value(value: Any) -> Any:
+    """Convert a numpy scalar to the equivalent Python number"""
+    item = getattr(value, 'item', None)
+    return value if item is None else item()
+
+
+def _value_reader(data: Any) -> Any:
+    """Return a function reading data[i] as a Python number"""
+    if np is not None and isinstance(data, np.ndarray):
+        return data.item
+    return data.__getitem__
+
+
+class StepLog:
+    """
+    Columnar (structure-of-arrays) store for tracked steps.
+    
+    Loop iterations are written as parallel left/right/mid/type columns
+    instead of one object per iteration; the few boundary steps (init,
+    not found) are kept as flat dicts whose metadata keys carry an ``m_``
+    prefix. The element values at left/mid/right are copied as Python
+    numbers when an iteration is recorded, so later changes to data do not
+    affect the log. Iterating or indexing the log materializes iterations
+    as Step objects.
+    """
+    
+    __slots__ = ('_value', '_target', '_count', '_extras', '_type', '_left', '_right', '_mid',
+                 '_left_values', '_mid_values', '_right_values')
+    
+    def __init__(self, data: List[Union[int, float]], target: Union[int, float], capacity: int = 64):
+        self._value = _value_reader(data)
+        self._target = _python_value(target)
+        self._count = 0
+        self._extras: Dict[int, Dict[str, Any]] = {}
+        self._type = _new_column('uint8', capacity)
+        self._left = _new_column('intp', capacity)
+        self._right = _new_column('intp', capacity)
+        self._mid = _new_column('intp', capacity)
+        self._left_values: List[Any] = [None] * capacity
+        self._mid_values: List[Any] = [None] * capacity
+        self._right_values: List[Any] = [None] * capacity
+    
+    def append(self, step: Dict[str, Any]) -> None:
+        """Append a boundary step dict"""
+        i = self._reserve()
+        self._type[i] = _DICT_STEP
+        self._extras[i] = step
+    
+    def record_iteration(self, left: int, right: int, mid: int, comparison: int) -> None:
+        """Append one loop iteration given its pointers and comparison code"""
+        i = self._reserve()
+        value = self._value
+        self._type[i] = comparison
+        self._left[i] = left
+        self._right[i] = right
+        self._mid[i] = mid
+        self._left_values[i] = value(left)
+        self._mid_values[i] = value(mid)
+        self._right_values[i] = value(right)
+    
+    def _reserve(self) -> int:
+        """Claim the next row, growing the columns when full"""
+        i = self._count
+        if i == len(self._type):
+            capacity = 2 * i + 1
+            self._type = _grow_column(self._type, capacity)
+            self._left = _grow_column(self._left, capacity)
+            self._right = _grow_column(self._right, capacity)
+            self._mid = _grow_column(self._mid, capacity)
+            padding = [None] * (capacity - i)
+            self._left_values += padding
+            self._mid_values += padding
+            self._right_values += padding
+        self._count = i + 1
+        return i
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def iterations(self) -> int:
+        """Number of recorded loop iterations"""
+        return self._count - len(self._extras)
+    
+    def __iter__(self):
+        count = self._count
+        target = self._target
+        comparisons = 0
+        for i, code, left, right, mid, left_value, mid_value, right_value in zip(
+            range(count),
+            _column_values(self._type, count),
+            _column_values(self._left, count),
+            _column_values(self._right, count),
+            _column_values(self._mid, count),
+            self._left_values,
+            self._mid_values,
+            self._right_values
+        ):
+            if code == _DICT_STEP:
+                yield self._extras[i]
+                continue
+            comparisons += 1
+            yield Step(
+                'iteration', left, right, mid, target,
+                left_value, mid_value, right_value,
+                _COMPARISON_NAMES[code], comparisons, i + 1
+            )
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('StepLog index out of range')
+        return self._row(index)
+    
+    def _row(self, i: int) -> Union[Step, Dict[str, Any]]:
+        """Materialize row i without walking the rest of the log"""
+        code = int(self._type[i])
+        if code == _DICT_STEP:
+            return self._extras[i]
+        # Every row before i that is not a boundary step is an iteration
+        comparisons = i + 1 - sum(1 for j in self._extras if j < i)
+        return Step(
+            'iteration', int(self._left[i]), int(self._right[i]), int(self._mid[i]), self._target,
+            self._left_values[i], self._mid_values[i], self._right_values[i],
+            _COMPARISON_NAMES[code], comparisons, i + 1
+        )
+
 
 class BinarySearchResult:
-    """Result object for binary search execution"""
+    """
+    Result object for binary search execution
+    
+    steps holds one Step object per loop iteration (use Step.describe()
+    or Step.to_dicts() for text) plus plain dicts for the init and
+    not-found boundary steps, whose metadata is stored flat under
+    'm_'-prefixed keys. Use to_dict()['steps'] for the legacy per-phase
+    step dicts with 'description' keys.
+    """
     
-    def __init__(self, found: bool, index: int, steps: List[Dict[str, Any]], comparisons: int):
+    def __init__(self, found: bool, index: int, steps: Union[StepLog, List[Union[Step, Dict[str, Any]]]],
+                 comparisons: int):
         self.found = found
         self.index = index
         self.steps = steps
         self.comparisons = comparisons
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary for JSON serialization"""
+    def to_dict(self, expand_ranges: bool = False, descriptions: bool = True) -> Dict[str, Any]:
+        """
+        Convert result to dictionary for JSON serialization
+        
+        Iteration steps are expanded into the legacy per-phase step dicts,
+        flat boundary steps get their nested 'metadata' dict back, and all
+        steps are numbered sequentially. Range steps carry an inclusive
+        ``indicesRange`` pair instead of a materialized index list. With
+        expand_ranges=True each pair is expanded into the legacy ``indices``
+        list. Descriptions skipped during execution are rendered here unless
+        descriptions=False, in which case every description is None.
+        """
+        if descriptions:
+            self.render_descriptions()
+        
+        # Each iteration expands to exactly four dicts, so the output size
+        # is known up front and the list never has to grow
+        if isinstance(self.steps, StepLog):
+            iterations = self.steps.iterations
+        else:
+            iterations = sum(isinstance(step, Step) for step in self.steps)
+        steps: List[Optional[Dict[str, Any]]] = [None] * (len(self.steps) + 3 * iterations)
+        i = 0
+        for step in self.steps:
+            if isinstance(step, Step):
+                for expanded in step.to_dicts(descriptions):
+                    i += 1
+                    expanded['operationCount'] = i
+                    steps[i - 1] = expanded
+            else:
+                step = self._nest_metadata(step)
+                if not descriptions:
+                    step['description'] = None
+                i += 1
+                step['operationCount'] = i
+                steps[i - 1] = step
+        del steps[i:]
+        
+        if expand_ranges:
+            steps = [self._expand_range(step) for step in steps]
         return {
             'found': self.found,
             'index': self.index,
-            'steps': self.steps,
+            'steps': steps,
             'comparisons': self.comparisons
         }
+    
+    def render_descriptions(self) -> None:
+        """Fill in step descriptions left as None by emit_descriptions=False"""
+        target = None
+        for step in self.steps:
+            if isinstance(step, Step):
+                continue
+            if step['type'] == 'init':
+                target = step['m_target']
+                if step['description'] is None:
+                    step['description'] = _init_description(target, step['m_arrayLength'])
+            elif step['description'] is None and step.get('m_searchExhausted'):
+                step['description'] = _not_found_description(target, step['m_totalComparisons'])
+    
+    @staticmethod
+    def _nest_metadata(step: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the legacy nested 'metadata' dict from a flat step's m_ keys"""
+        nested: Dict[str, Any] = {}
+        metadata: Dict[str, Any] = {}
+        for key, value in step.items():
+            if key.startswith('m_'):
+                metadata[key[2:]] = value
+            else:
+                nested[key] = value
+        nested['metadata'] = metadata
+        return nested
+    
+    @staticmethod
+    def _expand_range(step: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a step's indicesRange pair with the full list of indices"""
+        if 'indicesRange' not in step:
+            return step
+        expanded = dict(step)
+        start, end = expanded.pop('indicesRange')
+        expanded['indices'] = list(range(start, end + 1))
+        return expanded
+
+
+class _ReadOnlyDict(dict):
+    """
+    dict that rejects mutation but still serializes with json.dumps
+    
+    Copying or pickling yields a plain, mutable dict, since rebuilding
+    this class would go through the blocked __setitem__.
+    """
+    
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f'{type(self).__name__} is read-only')
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return dict, (dict(self),)
+
+
+def _test_case(data: Tuple[Union[int, float], ...], target: Union[int, float],
+               found: bool, index: int) -> Mapping[str, Any]:
+    """Build a read-only test case mapping"""
+    return _ReadOnlyDict({
+        'data': data,
+        'target': target,
+        'expected': _ReadOnlyDict({'found': found, 'index': index})
+    })
+
+
+_TEST_CASES = (
+    # Basic cases
+    _test_case((1, 3, 5, 7, 9), 5, True, 2),
+    _test_case((1, 3, 5, 7, 9), 1, True, 0),
+    _test_case((1, 3, 5, 7, 9), 9, True, 4),
+    _test_case((1, 3, 5, 7, 9), 4, False, -1),
+    
+    # Edge cases
+    _test_case((), 5, False, -1),
+    _test_case((5,), 5, True, 0),
+    _test_case((5,), 3, False, -1),
+    
+    # Larger arrays
+    _test_case((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), 7, True, 6),
+    _test_case((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), 11, False, -1),
+    
+    # Duplicate values
+    _test_case((1, 2, 2, 2, 5), 2, True, 1),  # May find any occurrence
+)
 
 
 class BinarySearchAlgorithm:
@@ -35,18 +491,29 @@ class BinarySearchAlgorithm:
     """
     
     def __init__(self):
-        self.steps: List[Dict[str, Any]] = []
+        self.steps: Union[StepLog, List[Dict[str, Any]]] = []
         self.comparisons = 0
     
     def execute(self, data: List[Union[int, float]], target: Union[int, float], 
-                track_steps: bool = True) -> BinarySearchResult:
+                track_steps: bool = True, validate: bool = True,
+                emit_descriptions: bool = True,
+                algorithm: Literal['binary', 'interp', 'auto'] = 'binary') -> BinarySearchResult:
         """
         Execute binary search with step-by-step tracking
         
         Args:
-            data: Sorted list of numbers to search in
+            data: Sorted list (or 1-D numpy array) of numbers to search in
             target: Target value to find
             track_steps: Whether to track steps for visualization
+            validate: Whether to run the O(n) input validation; callers that
+                already guarantee sorted, finite input can skip it
+            emit_descriptions: Whether to format step descriptions while
+                searching; when False they are left as None and can be
+                filled in later with BinarySearchResult.render_descriptions()
+            algorithm: 'binary' for plain binary search, 'interp' for
+                interpolation search (falling back to binary search after
+                bit_length(n) probes without a hit), or 'auto' to use
+                interpolation only when the data looks uniformly distributed
             
         Returns:
             BinarySearchResult containing found status, index, steps, and comparison count
@@ -58,203 +525,248 @@ class BinarySearchAlgorithm:
         self.steps = []
         self.comparisons = 0
         
-        # Input validation
-        self._validate_input(data, target)
+        use_interpolation = self._prepare_search(data, target, validate, algorithm)
+        target = _python_value(target)
+        
+        if not track_steps and not use_interpolation:
+            # Nothing to visualize, so use bisect; comparisons reports the
+            # number of probes it makes (at most bit_length(n))
+            index = _bisect_search(data, target)
+            self.comparisons = len(data).bit_length()
+            return BinarySearchResult(index != -1, index, self.steps, self.comparisons)
         
         if track_steps:
-            self._add_step({
-                'type': 'init',
-                'indices': [],
-                'metadata': {
-                    'target': target,
-                    'arrayLength': len(data),
-                    'algorithm': 'binary-search',
-                    'language': 'python'
-                },
-                'description': f'Initialize binary search for target {target} in sorted array of {len(data)} elements'
-            })
+            # At most bit_length(n) iterations (twice that when interpolation
+            # falls back to binary search) plus the init and final steps
+            max_iterations = len(data).bit_length() * (2 if use_interpolation else 1)
+            self.steps = StepLog(data, target, max_iterations + 2)
+        
+        index = -1
+        events = self._search_events(data, target, use_interpolation, emit_descriptions and track_steps)
+        for event in events:
+            if type(event) is tuple:
+                left, right, mid, comparison = event
+                self.comparisons += 1
+                if comparison == _CMP_EQUAL:
+                    index = mid
+                if track_steps:
+                    self.steps.record_iteration(left, right, mid, comparison)
+            elif track_steps:
+                self._add_step(event)
+        
+        return BinarySearchResult(index != -1, index, self.steps, self.comparisons)
+    
+    def execute_iter(self, data: List[Union[int, float]], target: Union[int, float],
+                     validate: bool = True, emit_descriptions: bool = True,
+                     algorithm: Literal['binary', 'interp', 'auto'] = 'binary'
+                     ) -> Iterator[Union[Step, Dict[str, Any]]]:
+        """
+        Execute a tracked search, yielding each step as it is produced
+        
+        Nothing is retained, so memory stays constant however long the
+        consumer (e.g. a UI rendering one step at a time) takes. Loop
+        iterations are yielded as Step objects (see Step.to_dicts()); the
+        init and final steps are flat dicts with ``m_``-prefixed metadata.
+        Input is validated before this returns, not on the first step.
+        The stream keeps its own counts and leaves self.steps and
+        self.comparisons alone, so execute() may be called on the same
+        instance while it is paused.
+        
+        Args:
+            data: Sorted list (or 1-D numpy array) of numbers to search in
+            target: Target value to find
+            validate: Whether to run the O(n) input validation
+            emit_descriptions: Whether to format boundary step descriptions
+            algorithm: 'binary', 'interp' or 'auto', as for execute()
+            
+        Returns:
+            Iterator over the steps of the search
+            
+        Raises:
+            ValueError: If input validation fails
+        """
+        use_interpolation = self._prepare_search(data, target, validate, algorithm)
+        target = _python_value(target)
+        return self._stream_steps(data, target, use_interpolation, emit_descriptions)
+    
+    def _prepare_search(self, data: List[Union[int, float]], target: Union[int, float],
+                        validate: bool, algorithm: str) -> bool:
+        """
+        Validate the input and choose the search strategy
+        
+        Returns:
+            Whether interpolation search should be used
+            
+        Raises:
+            ValueError: If validation fails or algorithm is unknown
+        """
+        if validate:
+            self._validate_input(data, target)
+        
+        if algorithm not in ('binary', 'interp', 'auto'):
+            raise ValueError(f"Unknown search algorithm: {algorithm!r}")
+        return algorithm == 'interp' or (algorithm == 'auto' and _looks_uniform(data))
+    
+    def _stream_steps(self, data: List[Union[int, float]], target: Union[int, float],
+                      use_interpolation: bool, emit_descriptions: bool
+                      ) -> Iterator[Union[Step, Dict[str, Any]]]:
+        """
+        Turn search events into numbered Step objects and step dicts
+        
+        Counts are kept per stream rather than on the instance, so the
+        instance can run other searches while a stream is paused.
+        """
+        operation_count = 0
+        comparisons = 0
+        value = _value_reader(data)
+        for event in self._search_events(data, target, use_interpolation, emit_descriptions):
+            operation_count += 1
+            if type(event) is tuple:
+                comparisons += 1
+                left, right, mid, comparison = event
+                yield Step(
+                    'iteration', left, right, mid, target,
+                    value(left), value(mid), value(right),
+                    _COMPARISON_NAMES[comparison], comparisons, operation_count
+                )
+            else:
+                event['operationCount'] = operation_count
+                yield event
+    
+    def _search_events(self, data: List[Union[int, float]], target: Union[int, float],
+                       use_interpolation: bool, emit_descriptions: bool
+                       ) -> Iterator[Union[Tuple[int, int, int, int], Dict[str, Any]]]:
+        """
+        Run the search as a stream of events
+        
+        Yields a (left, right, mid, comparison code) tuple per loop
+        iteration, i.e. per comparison, and a flat dict for each boundary
+        step. The generators keep no state on the instance; consumers count
+        the tuples themselves.
+        """
+        yield {
+            'type': 'init',
+            'indices': [],
+            'm_target': target,
+            'm_arrayLength': len(data),
+            'm_algorithm': 'interpolation-search' if use_interpolation else 'binary-search',
+            'm_language': 'python',
+            'description': _init_description(target, len(data)) if emit_descriptions else None
+        }
         
         # Handle edge cases
         if len(data) == 0:
-            if track_steps:
-                self._add_step({
-                    'type': 'eliminate',
-                    'indices': [],
-                    'metadata': {'found': False, 'reason': 'empty-array'},
-                    'description': 'Array is empty - target cannot be found'
-                })
-            return BinarySearchResult(False, -1, self.steps, self.comparisons)
-        
-        # Perform binary search
-        result = self._binary_search_core(data, target, track_steps)
-        
-        return BinarySearchResult(
-            result['found'],
-            result['index'],
-            self.steps,
-            self.comparisons
-        )
+            yield {
+                'type': 'eliminate',
+                'indices': [],
+                'm_found': False,
+                'm_reason': 'empty-array',
+                'description': 'Array is empty - target cannot be found'
+            }
+            return
+        
+        # Perform the search
+        if use_interpolation:
+            yield from self._interpolation_search_core(data, target, emit_descriptions)
+        else:
+            yield from self._binary_search_core(data, target, emit_descriptions)
     
-    def _binary_search_core(self, data: List[Union[int, float]], target: Union[int, float], 
-                           track_steps: bool) -> Dict[str, Any]:
+    def _binary_search_core(self, data: List[Union[int, float]], target: Union[int, float],
+                           emit_descriptions: bool = True, left: int = 0,
+                           right: Optional[int] = None, comparisons: int = 0
+                           ) -> Iterator[Union[Tuple[int, int, int, int], Dict[str, Any]]]:
         """
         Core binary search implementation with step tracking
+        
+        Searches the inclusive range [left, right], which defaults to the
+        whole array, yielding events as described in _search_events().
+        comparisons is the number already made by the caller, for the
+        total reported in the final step.
         """
-        left = 0
-        right = len(data) - 1
+        if right is None:
+            right = len(data) - 1
         
         while left <= right:
-            mid = (left + right) // 2
+            mid = (left + right) >> 1
             
-            if track_steps:
-                # Show current search range
-                self._add_step({
-                    'type': 'highlight',
-                    'indices': self._generate_range_indices(left, right),
-                    'metadata': {
-                        'left': left,
-                        'right': right,
-                        'mid': mid,
-                        'searchRange': True,
-                        'rangeSize': right - left + 1
-                    },
-                    'description': f'Search range: [{left}, {right}] ({right - left + 1} elements)'
-                })
-                
-                # Show pointer positions
-                self._add_step({
-                    'type': 'highlight',
-                    'indices': [left, mid, right],
-                    'metadata': {
-                        'left': left,
-                        'right': right,
-                        'mid': mid,
-                        'pointers': {'left': left, 'mid': mid, 'right': right},
-                        'leftValue': data[left],
-                        'midValue': data[mid],
-                        'rightValue': data[right]
-                    },
-                    'description': f'Pointers: left={left}({data[left]}), mid={mid}({data[mid]}), right={right}({data[right]})'
-                })
+            # Compare target with middle element once: -1 less, 0 equal, 1 greater
+            comparisons += 1
+            mid_value = data[mid]
+            comparison = 0 if target == mid_value else (1 if target > mid_value else -1)
             
-            # Compare target with middle element
-            self.comparisons += 1
+            yield (left, right, mid, _CMP_EQUAL + comparison)
             
-            if track_steps:
-                self._add_step({
-                    'type': 'compare',
-                    'indices': [mid],
-                    'metadata': {
-                        'left': left,
-                        'right': right,
-                        'mid': mid,
-                        'targetValue': target,
-                        'midValue': data[mid],
-                        'comparison': self._get_comparison_result(target, data[mid]),
-                        'comparisonCount': self.comparisons
-                    },
-                    'description': f'Compare: target({target}) {self._get_comparison_symbol(target, data[mid])} mid({data[mid]})'
-                })
-            
-            if data[mid] == target:
+            if comparison == 0:
                 # Target found
-                if track_steps:
-                    self._add_step({
-                        'type': 'found',
-                        'indices': [mid],
-                        'metadata': {
-                            'left': left,
-                            'right': right,
-                            'mid': mid,
-                            'found': True,
-                            'targetValue': target,
-                            'foundIndex': mid,
-                            'totalComparisons': self.comparisons
-                        },
-                        'description': f'🎉 Found target {target} at index {mid} after {self.comparisons} comparisons!'
-                    })
-                return {'found': True, 'index': mid}
+                return
             
-            elif data[mid] < target:
-                # Target is in right half - eliminate left half
-                if track_steps:
-                    eliminated_indices = self._generate_range_indices(left, mid)
-                    self._add_step({
-                        'type': 'eliminate',
-                        'indices': eliminated_indices,
-                        'metadata': {
-                            'left': left,
-                            'right': right,
-                            'mid': mid,
-                            'eliminated': 'left',
-                            'eliminatedRange': [left, mid],
-                            'reason': f'{data[mid]} < {target}',
-                            'remainingRange': [mid + 1, right],
-                            'remainingSize': right - mid
-                        },
-                        'description': f'{data[mid]} < {target}: eliminate left half [{left}, {mid}], search [{mid + 1}, {right}]'
-                    })
+            elif comparison > 0:
+                # Target is in right half
                 left = mid + 1
             
             else:
-                # Target is in left half - eliminate right half
-                if track_steps:
-                    eliminated_indices = self._generate_range_indices(mid, right)
-                    self._add_step({
-                        'type': 'eliminate',
-                        'indices': eliminated_indices,
-                        'metadata': {
-                            'left': left,
-                            'right': right,
-                            'mid': mid,
-                            'eliminated': 'right',
-                            'eliminatedRange': [mid, right],
-                            'reason': f'{data[mid]} > {target}',
-                            'remainingRange': [left, mid - 1],
-                            'remainingSize': mid - left
-                        },
-                        'description': f'{data[mid]} > {target}: eliminate right half [{mid}, {right}], search [{left}, {mid - 1}]'
-                    })
+                # Target is in left half
                 right = mid - 1
         
         # Target not found
-        if track_steps:
-            self._add_step({
-                'type': 'eliminate',
-                'indices': [],
-                'metadata': {
-                    'found': False,
-                    'totalComparisons': self.comparisons,
-                    'searchExhausted': True,
-                    'finalLeft': left,
-                    'finalRight': right
-                },
-                'description': f'❌ Target {target} not found after {self.comparisons} comparisons (search space exhausted)'
-            })
-        
-        return {'found': False, 'index': -1}
-    
-    def _generate_range_indices(self, start: int, end: int) -> List[int]:
-        """Generate list of indices for a given range"""
-        return list(range(start, end + 1))
+        yield {
+            'type': 'eliminate',
+            'indices': [],
+            'm_found': False,
+            'm_totalComparisons': comparisons,
+            'm_searchExhausted': True,
+            'm_finalLeft': left,
+            'm_finalRight': right,
+            'description': _not_found_description(target, comparisons) if emit_descriptions else None
+        }
     
-    def _get_comparison_result(self, target: Union[int, float], mid: Union[int, float]) -> str:
-        """Get comparison result as string"""
-        if target == mid:
-            return 'equal'
-        elif target < mid:
-            return 'less'
-        else:
-            return 'greater'
-    
-    def _get_comparison_symbol(self, target: Union[int, float], mid: Union[int, float]) -> str:
-        """Get comparison symbol for display"""
-        if target == mid:
-            return '=='
-        elif target < mid:
-            return '<'
-        else:
-            return '>'
+    def _interpolation_search_core(self, data: List[Union[int, float]], target: Union[int, float],
+                                   emit_descriptions: bool = True
+                                   ) -> Iterator[Union[Tuple[int, int, int, int], Dict[str, Any]]]:
+        """
+        Interpolation search with a binary search safety net
+        
+        Probes where target would sit if values grew linearly between the
+        current bounds. After bit_length(n) probes without a hit the
+        remaining range is handed to _binary_search_core, capping the worst
+        case at roughly twice a plain binary search. Values are read as
+        Python numbers so the arithmetic cannot overflow numpy fixed-width
+        integers.
+        """
+        value = _value_reader(data)
+        left = 0
+        right = len(data) - 1
+        probes_left = len(data).bit_length()
+        comparisons = 0
+        
+        while left <= right and probes_left > 0:
+            probes_left -= 1
+            
+            left_value = value(left)
+            right_value = value(right)
+            if right_value == left_value:
+                mid = left
+            else:
+                offset = int((target - left_value) / (right_value - left_value) * (right - left))
+                mid = min(max(left + offset, left), right)
+            
+            # Compare target with probed element
+            comparisons += 1
+            mid_value = value(mid)
+            comparison = 0 if target == mid_value else (1 if target > mid_value else -1)
+            
+            yield (left, right, mid, _CMP_EQUAL + comparison)
+            
+            if comparison == 0:
+                return
+            elif comparison > 0:
+                left = mid + 1
+            else:
+                right = mid - 1
+        
+        # Out of probes or range exhausted; the binary core finishes the
+        # search and records the final step
+        yield from self._binary_search_core(data, target, emit_descriptions, left, right, comparisons)
     
     def _add_step(self, step: Dict[str, Any]) -> None:
         """Add a step to the tracking array"""
@@ -268,11 +780,24 @@ class BinarySearchAlgorithm:
         Raises:
             ValueError: If validation fails
         """
-        if not isinstance(data, list):
-            raise ValueError('Input data must be a list')
+        self._validate_data(data)
         
-        if not isinstance(target, (int, float)) or not self._is_finite(target):
+        if not isinstance(target, Real) or not isfinite(target):
             raise ValueError('Target must be a finite number')
+    
+    def _validate_data(self, data: List[Union[int, float]]) -> None:
+        """
+        Validate the array to search
+        
+        Raises:
+            ValueError: If validation fails
+        """
+        if np is not None and isinstance(data, np.ndarray):
+            self._validate_array_data(data)
+            return
+        
+        if not isinstance(data, (list, tuple)):
+            raise ValueError('Input data must be a list or tuple')
         
         # Check if array is sorted (for educational purposes)
         for i in range(1, len(data)):
@@ -281,17 +806,28 @@ class BinarySearchAlgorithm:
         
         # Check for non-numeric values
         for i, value in enumerate(data):
-            if not isinstance(value, (int, float)) or not self._is_finite(value):
+            if not isinstance(value, (int, float)) or not isfinite(value):
                 raise ValueError(f'Array element at index {i} must be a finite number, got: {value}')
     
-    def _is_finite(self, value: Union[int, float]) -> bool:
-        """Check if a number is finite (not NaN or infinity)"""
-        try:
-            import math
-            return math.isfinite(value)
-        except (ImportError, AttributeError):
-            # Fallback for older Python versions
-            return isinstance(value, (int, float)) and str(value) not in ['nan', 'inf', '-inf']
+    def _validate_array_data(self, data: Any) -> None:
+        """
+        Vectorized validation for numpy array input
+        
+        Raises:
+            ValueError: If validation fails
+        """
+        if data.ndim != 1 or not np.issubdtype(data.dtype, np.number):
+            raise ValueError('Input array must be one-dimensional and numeric')
+        
+        unsorted = np.flatnonzero(data[1:] < data[:-1])
+        if unsorted.size:
+            i = int(unsorted[0]) + 1
+            raise ValueError(f'Array must be sorted for binary search. Found {data[i]} < {data[i - 1]} at indices {i} and {i - 1}')
+        
+        non_finite = np.flatnonzero(~np.isfinite(data))
+        if non_finite.size:
+            i = int(non_finite[0])
+            raise ValueError(f'Array element at index {i} must be a finite number, got: {data[i]}')
     
     @staticmethod
     def get_complexity_info() -> Dict[str, str]:
@@ -306,45 +842,358 @@ class BinarySearchAlgorithm:
         }
     
     @staticmethod
-    def generate_test_cases() -> List[Dict[str, Any]]:
-        """Generate test cases for educational purposes"""
-        return [
-            # Basic cases
-            {'data': [1, 3, 5, 7, 9], 'target': 5, 'expected': {'found': True, 'index': 2}},
-            {'data': [1, 3, 5, 7, 9], 'target': 1, 'expected': {'found': True, 'index': 0}},
-            {'data': [1, 3, 5, 7, 9], 'target': 9, 'expected': {'found': True, 'index': 4}},
-            {'data': [1, 3, 5, 7, 9], 'target': 4, 'expected': {'found': False, 'index': -1}},
-            
-            # Edge cases
-            {'data': [], 'target': 5, 'expected': {'found': False, 'index': -1}},
-            {'data': [5], 'target': 5, 'expected': {'found': True, 'index': 0}},
-            {'data': [5], 'target': 3, 'expected': {'found': False, 'index': -1}},
-            
-            # Larger arrays
-            {'data': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 'target': 7, 'expected': {'found': True, 'index': 6}},
-            {'data': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 'target': 11, 'expected': {'found': False, 'index': -1}},
-            
-            # Duplicate values
-            {'data': [1, 2, 2, 2, 5], 'target': 2, 'expected': {'found': True, 'index': 1}},  # May find any occurrence
-        ]
+    def generate_test_cases() -> Tuple[Mapping[str, Any], ...]:
+        """
+        Generate test cases for educational purposes
+        
+        Returns the shared, read-only _TEST_CASES. Each case is a read-only
+        dict whose data is a tuple; cases can be passed straight to
+        execute() and serialized with json.dumps.
+        """
+        return _TEST_CASES
+
+
+class StatefulBinarySearcher:
+    """
+    Binary search over one array that remembers where the last hit was.
+    
+    Each search gallops outward from the previous hit (1, 2, 4, ... elements
+    away) to bracket the target, then bisects only that bracket. Streams of
+    monotonic or clustered queries resolve in a few probes, while random
+    queries cost at most about twice a plain binary search. data must already
+    be sorted; assigning a new array to ``data`` resets the remembered
+    position.
+    """
+    
+    def __init__(self, data: List[Union[int, float]]):
+        self._data = data
+        self._last = 0
+    
+    @property
+    def data(self) -> List[Union[int, float]]:
+        return self._data
+    
+    @data.setter
+    def data(self, data: List[Union[int, float]]) -> None:
+        if data is not self._data:
+            self._data = data
+            self._last = 0
+    
+    def search(self, target: Union[int, float]) -> int:
+        """
+        Find target, starting from the previous hit
+        
+        Returns:
+            Index of the first occurrence of target if found, -1 otherwise
+        """
+        data = self._data
+        n = len(data)
+        if n == 0:
+            return -1
+        hint = min(self._last, n - 1)
+        
+        step = 1
+        if data[hint] < target:
+            # Gallop right: the answer lies after hint
+            lo = hint + 1
+            hi = hint + step
+            while hi < n and data[hi] < target:
+                lo = hi + 1
+                step *= 2
+                hi = hint + step
+            i = bisect_left(data, target, lo, min(hi, n))
+        else:
+            # Gallop left: the answer is at or before hint
+            hi = hint
+            lo = hint - step
+            while lo >= 0 and data[lo] >= target:
+                hi = lo
+                step *= 2
+                lo = hint - step
+            i = bisect_left(data, target, max(lo + 1, 0), hi)
+        
+        if i < n and data[i] == target:
+            self._last = i
+            return i
+        return -1
+
+
+def _monobound_search(arr: Any, target: Union[int, float]) -> int:
+    """
+    Branchless monobound binary search over a non-empty numpy array.
+    
+    Only a base index and a shrinking length are kept; the comparison result
+    is folded into the base arithmetically so the compiled loop has no
+    data-dependent branch.
+    """
+    base = 0
+    length = arr.shape[0]
+    while length > 1:
+        half = length >> 1
+        base += (arr[base + half - 1] < target) * half
+        length -= half
+    return base if arr[base] == target else -1
 
 
-def binary_search(data: List[Union[int, float]], target: Union[int, float]) -> int:
+# Numba's on-disk cache is not used: it records the importing module's name,
+# and this standalone file is loaded under varying names (and as __main__),
+# so a cache written by one loader breaks the next.
+@lru_cache(maxsize=None)
+def _typed_monobound_kernels() -> Dict[Any, Any]:
+    """
+    Compile int64/float64 builds of the monobound kernel, keyed by dtype
+    
+    Built on first use rather than at import so that importing the module
+    stays cheap; other dtypes use the lazily specialized generic dispatcher.
+    """
+    search = _monobound_search.py_func
+    return {
+        np.dtype(np.int64): njit('i8(i8[:], i8)')(search),
+        np.dtype(np.float64): njit('i8(f8[:], f8)')(search),
+    }
+
+
+if njit is not None:
+    _monobound_search = njit(fastmath=False)(_monobound_search)
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _search_array(data: Any, target: Union[int, float]) -> int:
+    """
+    Run the compiled monobound kernel on a non-empty numeric array
+    
+    Writeable int64 arrays searched for an integer and writeable float64
+    arrays go through the explicitly typed builds, skipping Numba's
+    per-call type dispatch. The typed signatures only accept mutable
+    arrays, so read-only ones (e.g. from np.frombuffer) and anything else
+    fall back to the generic kernel.
+    """
+    target = _python_value(target)
+    if isinstance(target, int) and not _INT64_MIN <= target <= _INT64_MAX:
+        # Numba cannot type integers beyond int64; compare in Python instead
+        return _bisect_search(data, target)
+    
+    kernel = _typed_monobound_kernels().get(data.dtype) if data.flags.writeable else None
+    if kernel is not None:
+        if data.dtype.kind == 'f':
+            return kernel(data, float(target))
+        if isinstance(target, int):
+            return kernel(data, target)
+    return int(_monobound_search(data, target))
+
+
+def _can_use_jit(data: Any) -> bool:
+    """Check whether data can be searched by the compiled monobound kernel"""
+    return (
+        njit is not None
+        and isinstance(data, np.ndarray)
+        and data.ndim == 1
+        and data.dtype.kind in 'iuf'
+        and data.dtype.isnative
+    )
+
+
+def _eytzinger_fill(out: Any, data: Any, i: int, k: int, order: Any = None) -> int:
+    """
+    Copy data[i:] into the subtree rooted at node k in order; return next i
+    
+    When order is given, order[k - 1] records the sorted index of each node.
+    """
+    if k <= len(data):
+        i = _eytzinger_fill(out, data, i, 2 * k, order)
+        out[k - 1] = data[i]
+        if order is not None:
+            order[k - 1] = i
+        i = _eytzinger_fill(out, data, i + 1, 2 * k + 1, order)
+    return i
+
+
+def _eytzinger_search(layout: Any, target: Union[int, float]) -> int:
+    """
+    Branchless descent of an Eytzinger layout.
+    
+    Node k (1-based) has children 2k and 2k + 1. The descent always runs to
+    the bottom; the lower bound is the last node where the walk went left,
+    recovered by stripping the trailing right-turns (one bits) and one more.
+    """
+    n = len(layout)
+    k = 1
+    while k <= n:
+        k = 2 * k + (layout[k - 1] < target)
+    while k & 1:
+        k >>= 1
+    k >>= 1
+    if k and layout[k - 1] == target:
+        return k - 1
+    return -1
+
+
+if njit is not None:
+    _eytzinger_search = njit(_eytzinger_search)
+
+
+def build_eytzinger(data: List[Union[int, float]], return_order: bool = False) -> Any:
+    """
+    Reorder sorted data into Eytzinger (breadth-first) layout
+    
+    The first levels of the implicit search tree share cache lines, so a
+    search touches far fewer lines than plain binary search on arrays that
+    do not fit in cache.
+    
+    Args:
+        data: Sorted list (or 1-D numpy array) of numbers
+        return_order: Also return the permutation mapping layout positions
+            back to indices in data
+        
+    Returns:
+        numpy array in Eytzinger order (a list when numpy is unavailable),
+        or a (layout, order) pair with return_order=True, where
+        layout[p] == data[order[p]]
+    """
+    if np is not None:
+        data = np.asarray(data)
+        out = np.empty_like(data)
+        order = np.empty(len(data), np.intp) if return_order else None
+    else:
+        out = [None] * len(data)
+        order = [0] * len(data) if return_order else None
+    _eytzinger_fill(out, data, 0, 1, order)
+    if return_order:
+        return out, order
+    return out
+
+
+def search_eytzinger(layout: Any, target: Union[int, float]) -> int:
+    """
+    Search a layout produced by build_eytzinger
+    
+    Finds the lower bound of target, i.e. the first occurrence in sorted
+    order. With duplicates this is not necessarily the first matching
+    position in layout: for [1, 2, 2, 2, 5] the layout is [2, 2, 5, 1, 2]
+    and searching 2 returns 1. Use the order array from
+    build_eytzinger(data, return_order=True) to map the result back to an
+    index in the sorted data.
+    
+    Args:
+        layout: Eytzinger-ordered array from build_eytzinger
+        target: Target value to find
+        
+    Returns:
+        Position in layout of the node holding the lower bound of target
+        if it equals target, -1 otherwise
+    """
+    target = _python_value(target)
+    if _can_use_jit(layout) and not (isinstance(target, int) and not _INT64_MIN <= target <= _INT64_MAX):
+        return int(_eytzinger_search(layout, target))
+    search = getattr(_eytzinger_search, 'py_func', _eytzinger_search)
+    return search(layout, target)
+
+
+def _looks_uniform(data: List[Union[int, float]], samples: int = 16, tolerance: float = 0.1) -> bool:
+    """
+    Heuristic check that values grow roughly linearly with their index
+    
+    Samples evenly spaced elements and compares each with the value a
+    straight line from data[0] to data[-1] predicts; every deviation must
+    be within tolerance of the total spread. Values are read as Python
+    numbers so numpy integer arrays cannot overflow.
+    """
+    n = len(data)
+    if n < samples:
+        return False
+    value = _value_reader(data)
+    first = value(0)
+    spread = value(n - 1) - first
+    if spread <= 0:
+        return False
+    step = (n - 1) / (samples - 1)
+    for k in range(1, samples - 1):
+        i = int(k * step)
+        expected = first + spread * i / (n - 1)
+        if abs(value(i) - expected) > tolerance * spread:
+            return False
+    return True
+
+
+def _bisect_search(data: List[Union[int, float]], target: Union[int, float]) -> int:
+    """
+    Untracked search using the stdlib's C bisect implementation.
+    
+    Returns the index of the first occurrence of target, or -1.
+    """
+    i = bisect_left(data, target)
+    if i < len(data) and data[i] == target:
+        return i
+    return -1
+
+
+def binary_search(data: List[Union[int, float]], target: Union[int, float],
+                  validate: bool = False) -> int:
     """
     Convenience function for simple binary search without step tracking
     
+    This is the hot path, so input validation is off by default; pass
+    validate=True to check that data is sorted and finite first.
+    
     Args:
-        data: Sorted list of numbers to search in
+        data: Sorted list (or 1-D numpy array) of numbers to search in
         target: Target value to find
+        validate: Whether to validate the input before searching
         
     Returns:
         Index of target if found, -1 otherwise
     """
+    if _can_use_jit(data):
+        if validate:
+            BinarySearchAlgorithm()._validate_input(data, target)
+        if data.shape[0] == 0:
+            return -1
+        return _search_array(data, target)
+    
+    if isinstance(data, (list, tuple)):
+        if validate:
+            BinarySearchAlgorithm()._validate_input(data, target)
+        return _bisect_search(data, target)
+    
     algorithm = BinarySearchAlgorithm()
-    result = algorithm.execute(data, target, track_steps=False)
+    result = algorithm.execute(data, target, track_steps=False, validate=validate)
     return result.index
 
 
+def binary_search_batch(data: List[Union[int, float]], targets: List[Union[int, float]],
+                        validate: bool = True) -> Any:
+    """
+    Search for many targets at once without step tracking
+    
+    data is validated once, then all targets are located in a single
+    vectorized np.searchsorted call.
+    
+    Args:
+        data: Sorted list (or 1-D numpy array) of numbers to search in
+        targets: Values to find
+        validate: Whether to validate data before searching
+        
+    Returns:
+        numpy array with the index of the first occurrence of each target,
+        or -1 where it is absent (a list when numpy is unavailable)
+    """
+    if validate:
+        BinarySearchAlgorithm()._validate_data(data)
+    
+    if np is None:
+        return [_bisect_search(data, target) for target in targets]
+    
+    array = np.ascontiguousarray(data)
+    targets = np.ascontiguousarray(targets)
+    if array.size == 0:
+        return np.full(targets.shape, -1, dtype=np.intp)
+    indices = np.searchsorted(array, targets)
+    hit = (indices < array.size) & (array[np.minimum(indices, array.size - 1)] == targets)
+    return np.where(hit, indices, -1)
+
+
 def binary_search_with_steps(data: List[Union[int, float]], target: Union[int, float]) -> BinarySearchResult:
     """
     Convenience function for binary search with full step tracking
@@ -373,8 +1222,9 @@ if __name__ == '__main__':
     print(f"Found: {result.found}")
     print(f"Index: {result.index}")
     print(f"Comparisons: {result.comparisons}")
-    print(f"Steps: {len(result.steps)}")
+    print(f"Iterations: {result.steps.iterations}")
+    print(f"Steps: {len(result.to_dict()['steps'])}")
     
     # Print steps for educational purposes
-    for i, step in enumerate(result.steps):
+    for i, step in enumerate(result.to_dict()['steps']):
         print(f"Step {i + 1}: {step['description']}")
\ No newline at end of file